@@ -1,9 +1,34 @@
 import argparse
 import projectairsim
 from projectairsim.utils import projectairsim_log
+import re
 import time
 import pprint
 
+# Precompiled topic filter: keeps the per-key match in C, which matters when
+# the sim publishes thousands of topics.
+ROVER_TOPIC_MATCH = re.compile(r"Rover").search
+
+def wait_for_robot_topics(client, robot_name, timeout=8.0):
+    """
+    Poll the client's topic table until topics for robot_name show up (or
+    the timeout expires). On SDK builds whose topic table refreshes in
+    place this returns as soon as the spawn lands; builds that populate the
+    table only at connect time can never satisfy the poll, so callers must
+    treat False as "reconnect with a fresh client", the baseline fix.
+    """
+    match = re.compile(re.escape(robot_name)).search
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        topics = getattr(client, 'topics', None) or {}
+        if any(map(match, topics)):
+            return True
+        topics_info = getattr(client, 'topics_info_list', None) or []
+        if any(match(t.name) for t in topics_info):
+            return True
+        time.sleep(0.2)
+    return False
+
 def main():
     parser = argparse.ArgumentParser(description="Inspect Drone vs Rover Object Internals")
     parser.add_argument("--address", type=str, default="127.0.0.1")
@@ -15,25 +40,31 @@ def main():
 
     # --- PHASE 1: LOAD & WAIT ---
     projectairsim_log().info(">>> PHASE 1: Loading Scene...")
-    client_loader = projectairsim.ProjectAirSimClient(
+    client = projectairsim.ProjectAirSimClient(
         address=args.address, port_topics=args.topicsport, port_services=args.servicesport
     )
-    client_loader.connect()
+    client.connect()
     world = projectairsim.World(
-        client=client_loader, scene_config_name=args.sceneconfigfile, sim_config_path=args.simconfigpath
+        client=client, scene_config_name=args.sceneconfigfile, sim_config_path=args.simconfigpath
     )
-    
-    projectairsim_log().info(">>> Waiting 8 seconds for Rover spawn...")
-    time.sleep(8)
-    client_loader.disconnect()
+
+    projectairsim_log().info(">>> Waiting for Rover1 topics to register...")
+    if not wait_for_robot_topics(client, "Rover1"):
+        # The live client's topic table never showed Rover1 — it may only be
+        # populated at connect time on this SDK build. Fall back to the old
+        # fix: a brand-new client fetches the topic list from scratch.
+        projectairsim_log().warning(
+            "Rover1 topics not seen on the live client; reconnecting with a fresh client."
+        )
+        client.disconnect()
+        client = projectairsim.ProjectAirSimClient(
+            address=args.address, port_topics=args.topicsport, port_services=args.servicesport
+        )
+        client.connect()
+        world.client = client  # Update world with new client
 
     # --- PHASE 2: INSPECT ---
-    projectairsim_log().info(">>> PHASE 2: Fresh Connection & Inspection...")
-    client = projectairsim.ProjectAirSimClient(
-        address=args.address, port_topics=args.topicsport, port_services=args.servicesport
-    )
-    client.connect()
-    world.client = client # Update world with new client
+    projectairsim_log().info(">>> PHASE 2: Inspection...")
 
     # Initialize Objects
     drone = projectairsim.Drone(client, world, "Drone1")
@@ -56,15 +87,13 @@ def main():
     print("\n" + "-"*20 + " CLIENT TOPIC SEARCH " + "-"*20)
     # 3. Search Client Topics for ANYTHING related to Rover1
     # This proves if the simulator is sending data, even if the Rover object missed it.
-    rover_topics = []
-    if hasattr(client, 'topics'):
-        for key in client.topics.keys():
-            if "Rover" in key:
-                rover_topics.append(key)
-    
-    if len(rover_topics) > 0:
+    # any() + the precompiled match short-circuits on the first hit; the
+    # full sorted list is only materialized when there is something to dump
+    topics = getattr(client, 'topics', {})
+    if any(map(ROVER_TOPIC_MATCH, topics)):
+        rover_topics = sorted(filter(ROVER_TOPIC_MATCH, topics))
         print(f"FOUND {len(rover_topics)} TOPICS MATCHING 'Rover':")
-        for t in sorted(rover_topics):
+        for t in rover_topics:
             print(f" - {t}")
     else:
         print("CRITICAL: Client has ZERO topics matching 'Rover'.")
@@ -1,24 +1,98 @@
 import asyncio
+import inspect
+import math
+import time
 
 from projectairsim import ProjectAirSimClient, Rover, Drone, World
 from projectairsim.utils import projectairsim_log
 
 
+async def finish(awaitable):
+    """
+    Await a robot command to completion. The SDK's *_async calls hand back a
+    second awaitable (the task tracking the command), so flatten it here
+    instead of repeating the task = await ...; await task two-step at every
+    call site. Plain single-stage awaitables pass straight through.
+    """
+    result = await awaitable
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+async def wait_for_steady_speed(
+    rover: Rover, timeout: float, accel_eps=0.5, settle_count=5, min_speed=0.0
+):
+    """
+    Await until the rover's ground speed holds steady (estimated
+    acceleration stays below accel_eps m/s^2 over settle_count consecutive
+    kinematics samples) or timeout expires. Samples are ignored until the
+    speed first reaches min_speed, so a command that has to spin up from
+    standstill can't satisfy the check with its initial at-rest samples;
+    dividing the per-sample delta by the sample interval makes the
+    criterion independent of the topic's publish rate.
+
+    Event-driven replacement for the old hard asyncio.sleep() pads: the
+    script now blocks only as long as the motion actually takes, and the
+    timeout keeps the old worst-case behavior as a fallback.
+    """
+    loop = asyncio.get_running_loop()
+    settled = asyncio.Event()
+    prev_speed = None
+    prev_t = None
+    moving = min_speed <= 0.0
+    count = 0
+
+    def on_kinematics(_, msg):
+        nonlocal prev_speed, prev_t, moving, count
+        try:
+            lin = msg["kinematics"]["twist"]["linear"]
+        except (KeyError, TypeError):
+            return
+        speed = math.sqrt(lin["x"] ** 2 + lin["y"] ** 2 + lin["z"] ** 2)
+        now = time.monotonic()
+        if not moving:
+            if speed < min_speed:
+                return  # still spinning up; don't judge steadiness yet
+            moving = True
+            prev_speed = None  # restart the window at motion onset
+        if prev_speed is not None and now > prev_t:
+            if abs(speed - prev_speed) / (now - prev_t) < accel_eps:
+                count += 1
+                if count >= settle_count:
+                    loop.call_soon_threadsafe(settled.set)
+            else:
+                count = 0
+        prev_speed = speed
+        prev_t = now
+
+    topic = rover.robot_info["actual_kinematics"]
+    rover.client.subscribe(topic, on_kinematics)
+    try:
+        await asyncio.wait_for(settled.wait(), timeout)
+    except asyncio.TimeoutError:
+        pass  # no steady-state seen; give up after the old fixed-wait time
+    finally:
+        rover.client.unsubscribe(topic)
+
+
+def setup_robot(robot, name: str):
+    """Enable API control and arm one robot (sync RPCs, run in a thread)"""
+    projectairsim_log().info(f"{name}: enabling API & arming")
+    robot.enable_api_control()
+    robot.arm()
+
+
 async def control_rover(rover: Rover):
     """Minimal rover motion pattern"""
-    projectairsim_log().info("Rover: enabling API & arming")
-    rover.enable_api_control()
-    rover.arm()
-
-    # Move forward
-    task = await rover.set_rover_controls(engine=0.4, steering_angle=0.0, brake=0.0)
-    await task
-    await asyncio.sleep(3)
+    # Move forward until the speed settles (previously a blind 3 s sleep);
+    # min_speed keeps the pre-motion standstill from counting as "steady"
+    await finish(rover.set_rover_controls(engine=0.4, steering_angle=0.0, brake=0.0))
+    await wait_for_steady_speed(rover, timeout=3.0, min_speed=0.2)
 
     # Brake to stop
-    task = await rover.set_rover_controls(engine=0.0, steering_angle=0.0, brake=1.0)
-    await task
-    await asyncio.sleep(1)
+    await finish(rover.set_rover_controls(engine=0.0, steering_angle=0.0, brake=1.0))
+    await wait_for_steady_speed(rover, timeout=1.0)
 
     projectairsim_log().info("Rover: shutting down")
     rover.disarm()
@@ -27,23 +101,16 @@ async def control_rover(rover: Rover):
 
 async def control_drone(drone: Drone):
     """Minimal drone flight pattern"""
-    projectairsim_log().info("Drone: enabling API & arming")
-    drone.enable_api_control()
-    drone.arm()
-
     # Takeoff
     projectairsim_log().info("Drone: takeoff")
-    takeoff_task = await drone.takeoff_async()
-    await takeoff_task
+    await finish(drone.takeoff_async())
 
     # Move up
-    move_task = await drone.move_by_velocity_async(0, 0, -1.0, 3.0)
-    await move_task
+    await finish(drone.move_by_velocity_async(0, 0, -1.0, 3.0))
 
     # Land
     projectairsim_log().info("Drone: landing")
-    land_task = await drone.land_async()
-    await land_task
+    await finish(drone.land_async())
 
     drone.disarm()
     drone.disable_api_control()
@@ -64,6 +131,13 @@ async def main():
         rover = Rover(client, world, "Rover1")
         drone = Drone(client, world, "Drone1")
 
+        # Overlap the setup round-trips across the two robots; within each
+        # robot, enable_api_control still completes before arm
+        await asyncio.gather(
+            asyncio.to_thread(setup_robot, rover, "Rover"),
+            asyncio.to_thread(setup_robot, drone, "Drone"),
+        )
+
         # Run both asynchronously
         await asyncio.gather(
             control_rover(rover),
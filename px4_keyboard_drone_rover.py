@@ -12,9 +12,17 @@ import asyncio
 import threading
 import projectairsim
 from projectairsim.utils import projectairsim_log
-import os
 import time
 
+# Optional: uvloop's libuv-backed event loop roughly halves per-await
+# overhead in the rover control loop. Fall back to the default loop
+# (e.g. on Windows) when it isn't installed.
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 # --- PYNPUT SETUP ---
 try:
     from pynput import keyboard
@@ -33,27 +41,81 @@ ENGINE_MAX = 1.0
 STEER_MIN = -1.0
 STEER_MAX = 1.0
 
+# Bit assignments for the key bitmask shared with the listener thread.
+# A plain int avoids set-hash overhead and is read/written atomically under
+# the GIL, so neither side needs a lock.
+BIT_UP = 1
+BIT_DOWN = 2
+BIT_LEFT = 4
+BIT_RIGHT = 8
+BIT_SPACE = 16
+
+KEYMAP = {
+    Key.up: BIT_UP,
+    Key.down: BIT_DOWN,
+    Key.left: BIT_LEFT,
+    Key.right: BIT_RIGHT,
+    Key.space: BIT_SPACE,
+}
+
 # Global state to share between the pynput thread and the asyncio loop
 class RoverState:
     def __init__(self):
-        self.keys_pressed = set()
-        self.running = True
+        self.mask = 0
+        self.stop = threading.Event()
+        # Filled in by rover_keyboard_loop() so the pynput callbacks can wake
+        # the asyncio loop from the listener thread.
+        self.loop = None
+        self.key_events = None
+        # Set once the rover loop's teardown (final brake, disarm, disable)
+        # has finished, so main() doesn't disconnect the client mid-teardown.
+        self.teardown_done = threading.Event()
 
 rover_state = RoverState()
 
+def notify_key_event(event, key):
+    """Wake the asyncio keyboard loop from the pynput listener thread."""
+    loop = rover_state.loop
+    if loop is not None:
+        loop.call_soon_threadsafe(rover_state.key_events.put_nowait, (event, key))
+
+def signal_rover_stop():
+    """
+    Set the stop event AND wake the rover loop. The loop blocks on the
+    key-event queue while idle, so a stop set outside the pynput callbacks
+    (Ctrl-C in main, a rover-thread failure) must also push a wakeup or the
+    loop would stay parked in get() and never run its teardown (final
+    brake, disarm, disable API control).
+    """
+    rover_state.stop.set()
+    try:
+        notify_key_event("stop", None)
+    except RuntimeError:
+        pass  # rover loop already shut down; nothing left to wake
+
 def on_press(key):
     """Callback when a key is pressed."""
-    rover_state.keys_pressed.add(key)
+    bit = KEYMAP.get(key, 0)
+    if not bit:
+        # Unmapped key: short-circuit here so typing in other apps never
+        # touches the mask or wakes the asyncio loop.
+        return
+    rover_state.mask |= bit
+    notify_key_event("press", key)
 
 def on_release(key):
     """Callback when a key is released."""
     if key == keyboard.KeyCode.from_char('q'):
         # Press 'q' to stop everything
-        rover_state.running = False
+        rover_state.stop.set()
+        notify_key_event("release", key)  # wake the loop so it sees the stop event
         return False # Stop listener
-    
-    if key in rover_state.keys_pressed:
-        rover_state.keys_pressed.remove(key)
+
+    bit = KEYMAP.get(key, 0)
+    if not bit:
+        return
+    rover_state.mask &= ~bit
+    notify_key_event("release", key)
 
 async def rover_keyboard_loop(rover: projectairsim.Rover):
     """
@@ -62,7 +124,14 @@ async def rover_keyboard_loop(rover: projectairsim.Rover):
     engine = 0.0
     steer = 0.0
     brake = 0.0
-    
+
+    # Queue of key events pushed in by the pynput callbacks. The loop blocks
+    # on it while idle instead of waking every 20 ms to re-check the key set.
+    loop = asyncio.get_running_loop()
+    key_events = asyncio.Queue()
+    rover_state.loop = loop
+    rover_state.key_events = key_events
+
     # Start the non-blocking keyboard listener
     listener = keyboard.Listener(on_press=on_press, on_release=on_release)
     listener.start()
@@ -74,54 +143,55 @@ async def rover_keyboard_loop(rover: projectairsim.Rover):
         "You can now click on the AirSim window and control the rover!"
     )
 
-    while rover_state.running:
+    # Hoist the hot-loop lookups to locals: these run up to 50x/sec while a
+    # key is held.
+    engine_step = ENGINE_STEP
+    steer_step = STEER_STEP
+
+    # Last command actually sent to the sim, for RPC coalescing
+    last_sent = (engine, steer, brake)
+    last_sent_t = 0.0
+
+    # At most one set_rover_controls RPC in flight at a time; the loop never
+    # awaits it inline, so input handling stays decoupled from sim RTT.
+    inflight = None
+    send_pending = False
+
+    while not rover_state.stop.is_set():
         controls_updated = False
-        
-        # Calculate target values based on currently held keys
-        target_engine = 0.0
-        target_steer = 0.0
-        new_brake = 0.0
-
-        # Check for specific keys in the set
-        # UP ARROW
-        if Key.up in rover_state.keys_pressed:
-            target_engine = 1.0 # Drive forward
-        # DOWN ARROW
-        elif Key.down in rover_state.keys_pressed:
-            target_engine = -1.0 # Reverse
-        
-        # LEFT ARROW
-        if Key.left in rover_state.keys_pressed:
-            target_steer = -1.0 # Full Left
-        # RIGHT ARROW
-        elif Key.right in rover_state.keys_pressed:
-            target_steer = 1.0 # Full Right
-            
-        # SPACE (Brake)
-        if Key.space in rover_state.keys_pressed:
+
+        # Single atomic read of the key bitmask for this tick
+        mask = rover_state.mask
+
+        # Branchless targets from the bit layout (UP=1, DOWN=2, LEFT=4,
+        # RIGHT=8): opposing keys held together cancel out to 0.0
+        target_engine = float((mask & BIT_UP) - ((mask & BIT_DOWN) >> 1))
+        target_steer = float(((mask & BIT_RIGHT) >> 3) - ((mask & BIT_LEFT) >> 2))
+
+        # SPACE (Brake) overrides everything
+        if mask & BIT_SPACE:
             new_brake = 1.0
             target_engine = 0.0
             target_steer = 0.0
+        else:
+            new_brake = 0.0
 
         # Logic: Smoothly ramp values or instant set?
         # For arrow keys, "instant set" usually feels more responsive for games,
         # but we can ramp if we want "heavy" physics. 
         # Here we will ramp purely to keep it smooth.
 
-        # --- Engine Ramping ---
-        if engine < target_engine:
-            engine = min(engine + ENGINE_STEP, target_engine)
-            controls_updated = True
-        elif engine > target_engine:
-            engine = max(engine - ENGINE_STEP, target_engine)
+        # --- Engine Ramping (sign-step: step toward the target, landing on
+        # it exactly once within one step; no min/max builtin dispatch) ---
+        d = target_engine - engine
+        if d != 0.0:
+            engine += engine_step if d > engine_step else -engine_step if d < -engine_step else d
             controls_updated = True
-        
+
         # --- Steering Ramping ---
-        if steer < target_steer:
-            steer = min(steer + STEER_STEP, target_steer)
-            controls_updated = True
-        elif steer > target_steer:
-            steer = max(steer - STEER_STEP, target_steer)
+        d = target_steer - steer
+        if d != 0.0:
+            steer += steer_step if d > steer_step else -steer_step if d < -steer_step else d
             controls_updated = True
 
         # --- Brake Logic ---
@@ -129,18 +199,56 @@ async def rover_keyboard_loop(rover: projectairsim.Rover):
             brake = new_brake
             controls_updated = True
             
-        # Send controls
-        if controls_updated or abs(engine) > 0.01 or abs(steer) > 0.01:
-            # We send commands as long as we are moving or changing state
-            await rover.set_rover_controls(
-                engine=engine, steering_angle=steer, brake=brake
-            )
-        
-        # Short sleep to yield control
-        await asyncio.sleep(0.02)
-    
+        # Send controls, coalescing the RPCs: tiny ramp increments aren't
+        # worth a round-trip each, so skip the send unless the command moved
+        # past a dirty threshold, the brake toggled, 100 ms have elapsed, or
+        # the ramp just settled on its final value.
+        if controls_updated:
+            now = time.monotonic()
+            settled = engine == target_engine and steer == target_steer
+            if (
+                abs(engine - last_sent[0]) > 0.02
+                or abs(steer - last_sent[1]) > 0.02
+                or brake != last_sent[2]
+                or now - last_sent_t > 0.1
+                or (settled and (engine, steer, brake) != last_sent)
+            ):
+                send_pending = True
+
+        # Fire-and-forget: schedule the RPC as a task instead of awaiting it
+        # inline. If the previous one is still outstanding, retry next tick.
+        if send_pending:
+            if inflight is None or inflight.done():
+                if inflight is not None and not inflight.cancelled():
+                    exc = inflight.exception()
+                    if exc is not None:
+                        raise exc  # surface RPC failures as before
+                inflight = asyncio.create_task(
+                    rover.set_rover_controls(
+                        engine=engine, steering_angle=steer, brake=brake
+                    )
+                )
+                last_sent = (engine, steer, brake)
+                last_sent_t = time.monotonic()
+                send_pending = False
+
+        # Event-driven wait: while ramping toward a target, keep ticking at
+        # 20 ms; once settled, block until the next real key event arrives
+        # (no idle wakeups at all).
+        needs_ramp = engine != target_engine or steer != target_steer or send_pending
+        if needs_ramp:
+            try:
+                await asyncio.wait_for(key_events.get(), timeout=0.02)
+            except asyncio.TimeoutError:
+                pass
+        else:
+            await key_events.get()
+
     # Cleanup
     listener.stop()
+    if inflight is not None:
+        # Let the last fire-and-forget RPC drain before the stop command
+        await asyncio.gather(inflight, return_exceptions=True)
     projectairsim_log().info("Rover teleop: disarming & disabling API control.")
     await rover.set_rover_controls(engine=0.0, steering_angle=0.0, brake=1.0)
     rover.disarm()
@@ -161,8 +269,13 @@ def start_rover_keyboard_control(client: projectairsim.ProjectAirSimClient,
         asyncio.run(rover_keyboard_loop(rover))
     except Exception as e:
         projectairsim_log().error(f"Rover keyboard control exception: {e}", exc_info=True)
-        # Ensure main loop dies if rover thread dies
-        os._exit(1) 
+        # Signal the main thread so it runs its normal teardown (client
+        # disconnect) instead of os._exit(), which skipped the finally blocks
+        # and left the sim holding stale subscriptions.
+        signal_rover_stop()
+    finally:
+        # Unblocks main's pre-disconnect wait, even if the loop died early
+        rover_state.teardown_done.set()
 
 
 # ---------------------- Drone (PX4) Connection ----------------------
@@ -184,13 +297,18 @@ def main(client: projectairsim.ProjectAirSimClient, robot_name: str, world: proj
     projectairsim_log().info("================================================================")
 
     try:
-        while rover_state.running:
-            time.sleep(1)
+        # Block until 'Q' is pressed; no 1 s polling wakeups, and shutdown
+        # is immediate instead of up to a second late.
+        rover_state.stop.wait()
     except KeyboardInterrupt:
         print()
         projectairsim_log().info("Exiting...")
-        rover_state.running = False
+        signal_rover_stop()
     finally:
+        # Let the rover thread finish its teardown (final brake, disarm,
+        # disable API control) before pulling the client connection out from
+        # under it; the old 1 s poll slack used to hide this race.
+        rover_state.teardown_done.wait(timeout=5.0)
         client.disconnect()
         print("Client disconnected.")
 
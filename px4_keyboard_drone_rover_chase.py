@@ -8,15 +8,36 @@ AND adds GLOBAL keyboard control (Arrow Keys) for a rover.
 INCLUDES: Dual Camera Display (Drone & Rover) with CONNECTION RETRY LOGIC.
 """
 import argparse
+import re
 import sys
 import asyncio
 import threading
+import queue
 import projectairsim
 from projectairsim.utils import projectairsim_log
 from projectairsim.image_utils import ImageDisplay 
-import os
 import time
 
+# Optional: uvloop's libuv-backed event loop roughly halves per-await
+# overhead in the rover control loop. Fall back to the default loop
+# (e.g. on Windows) when it isn't installed.
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+# Optional: libjpeg-turbo's SIMD-accelerated JPEG decoder, shared by both
+# chase-cam feeds. JPEG IDCT dominates the frame cost when the sim sends
+# compressed frames; one TurboJPEG instance serves both windows. Frames
+# that aren't JPEG, or environments without PyTurboJPEG, fall through to
+# ImageDisplay's built-in decode as before.
+try:
+    from turbojpeg import TurboJPEG
+    turbo_jpeg = TurboJPEG()
+except Exception:
+    turbo_jpeg = None
+
 # --- PYNPUT SETUP ---
 try:
     from pynput import keyboard
@@ -35,25 +56,89 @@ ENGINE_MAX = 1.0
 STEER_MIN = -1.0
 STEER_MAX = 1.0
 
+# Bit assignments for the key bitmask shared with the listener thread.
+# A plain int avoids set-hash overhead and is read/written atomically under
+# the GIL, so neither side needs a lock.
+BIT_UP = 1
+BIT_DOWN = 2
+BIT_LEFT = 4
+BIT_RIGHT = 8
+BIT_SPACE = 16
+
+KEYMAP = {
+    Key.up: BIT_UP,
+    Key.down: BIT_DOWN,
+    Key.left: BIT_LEFT,
+    Key.right: BIT_RIGHT,
+    Key.space: BIT_SPACE,
+}
+
 class RoverState:
     def __init__(self):
-        self.keys_pressed = set()
-        self.running = True
+        self.mask = 0
+        self.stop = threading.Event()
+        # Filled in by rover_keyboard_loop() so the pynput callbacks can wake
+        # the asyncio loop from the listener thread.
+        self.loop = None
+        self.key_events = None
+        # Set once the rover loop's teardown (final brake, disarm, disable)
+        # has finished, so main() doesn't disconnect the client mid-teardown.
+        self.teardown_done = threading.Event()
+        # Current pynput listener, so the focus handler can pause/resume it
+        self.listener = None
 
 rover_state = RoverState()
 
+def notify_key_event(event, key):
+    """Wake the asyncio keyboard loop from the pynput listener thread."""
+    loop = rover_state.loop
+    if loop is not None:
+        loop.call_soon_threadsafe(rover_state.key_events.put_nowait, (event, key))
+
+def signal_rover_stop():
+    """
+    Set the stop event AND wake the rover loop. The loop blocks on the
+    key-event queue while idle, so a stop set outside the pynput callbacks
+    (Ctrl-C in main, a rover-thread failure) must also push a wakeup or the
+    loop would stay parked in get() and never run its teardown (final
+    brake, disarm, disable API control).
+    """
+    rover_state.stop.set()
+    try:
+        notify_key_event("stop", None)
+    except RuntimeError:
+        pass  # rover loop already shut down; nothing left to wake
+
 def on_press(key):
-    rover_state.keys_pressed.add(key)
+    bit = KEYMAP.get(key, 0)
+    if not bit:
+        # Unmapped key: short-circuit here so typing in other apps never
+        # touches the mask or wakes the asyncio loop.
+        return
+    rover_state.mask |= bit
+    notify_key_event("press", key)
 
 def on_release(key):
     if key == keyboard.KeyCode.from_char('q'):
-        rover_state.running = False
+        rover_state.stop.set()
+        notify_key_event("release", key)  # wake the loop so it sees the stop event
         return False
-    if key in rover_state.keys_pressed:
-        rover_state.keys_pressed.remove(key)
+    bit = KEYMAP.get(key, 0)
+    if not bit:
+        return
+    rover_state.mask &= ~bit
+    notify_key_event("release", key)
 
 async def rover_keyboard_loop(rover: projectairsim.Rover):
+    # Queue of key events pushed in by the pynput callbacks. The loop blocks
+    # on it while idle instead of waking every 20 ms to re-check the key set.
+    loop = asyncio.get_running_loop()
+    key_events = asyncio.Queue()
+    rover_state.loop = loop
+    rover_state.key_events = key_events
+
     listener = keyboard.Listener(on_press=on_press, on_release=on_release)
+    rover_state.listener = listener
     listener.start()
 
     projectairsim_log().info("Rover controls (Global): ARROW KEYS to move, SPACE=brake, Q=quit")
@@ -63,57 +148,107 @@ async def rover_keyboard_loop(rover: projectairsim.Rover):
     steer = 0.0
     brake = 0.0
 
-    while rover_state.running:
+    # Hoist the hot-loop lookups to locals: these run up to 50x/sec while a
+    # key is held.
+    engine_step = ENGINE_STEP
+    steer_step = STEER_STEP
+
+    # Last command actually sent to the sim, for RPC coalescing
+    last_sent = (engine, steer, brake)
+    last_sent_t = 0.0
+
+    # At most one set_rover_controls RPC in flight at a time; the loop never
+    # awaits it inline, so input handling stays decoupled from sim RTT.
+    inflight = None
+    send_pending = False
+
+    async def send_controls(engine, steer, brake):
+        try:
+            await rover.set_rover_controls(
+                engine=engine, steering_angle=steer, brake=brake
+            )
+        except Exception:
+            pass # Ignore connection blips
+
+    while not rover_state.stop.is_set():
         controls_updated = False
-        target_engine = 0.0
-        target_steer = 0.0
-        new_brake = 0.0
-
-        if Key.up in rover_state.keys_pressed:
-            target_engine = 1.0
-        elif Key.down in rover_state.keys_pressed:
-            target_engine = -1.0
-        
-        if Key.left in rover_state.keys_pressed:
-            target_steer = -1.0
-        elif Key.right in rover_state.keys_pressed:
-            target_steer = 1.0
-            
-        if Key.space in rover_state.keys_pressed:
+
+        # Single atomic read of the key bitmask for this tick
+        mask = rover_state.mask
+
+        # Branchless targets from the bit layout (UP=1, DOWN=2, LEFT=4,
+        # RIGHT=8): opposing keys held together cancel out to 0.0
+        target_engine = float((mask & BIT_UP) - ((mask & BIT_DOWN) >> 1))
+        target_steer = float(((mask & BIT_RIGHT) >> 3) - ((mask & BIT_LEFT) >> 2))
+
+        # SPACE (Brake) overrides everything
+        if mask & BIT_SPACE:
             new_brake = 1.0
             target_engine = 0.0
             target_steer = 0.0
+        else:
+            new_brake = 0.0
 
-        # Ramping logic
-        if engine < target_engine:
-            engine = min(engine + ENGINE_STEP, target_engine)
-            controls_updated = True
-        elif engine > target_engine:
-            engine = max(engine - ENGINE_STEP, target_engine)
-            controls_updated = True
-        
-        if steer < target_steer:
-            steer = min(steer + STEER_STEP, target_steer)
+        # Ramping logic (sign-step: step toward the target, landing on it
+        # exactly once within one step; no min/max builtin dispatch)
+        d = target_engine - engine
+        if d != 0.0:
+            engine += engine_step if d > engine_step else -engine_step if d < -engine_step else d
             controls_updated = True
-        elif steer > target_steer:
-            steer = max(steer - STEER_STEP, target_steer)
+
+        d = target_steer - steer
+        if d != 0.0:
+            steer += steer_step if d > steer_step else -steer_step if d < -steer_step else d
             controls_updated = True
 
         if brake != new_brake:
             brake = new_brake
             controls_updated = True
             
-        if controls_updated or abs(engine) > 0.01 or abs(steer) > 0.01:
+        # Send controls, coalescing the RPCs: tiny ramp increments aren't
+        # worth a round-trip each, so skip the send unless the command moved
+        # past a dirty threshold, the brake toggled, 100 ms have elapsed, or
+        # the ramp just settled on its final value.
+        if controls_updated:
+            now = time.monotonic()
+            settled = engine == target_engine and steer == target_steer
+            if (
+                abs(engine - last_sent[0]) > 0.02
+                or abs(steer - last_sent[1]) > 0.02
+                or brake != last_sent[2]
+                or now - last_sent_t > 0.1
+                or (settled and (engine, steer, brake) != last_sent)
+            ):
+                send_pending = True
+
+        # Fire-and-forget: schedule the RPC as a task instead of awaiting it
+        # inline. If the previous one is still outstanding, retry next tick.
+        if send_pending:
+            if inflight is None or inflight.done():
+                inflight = asyncio.create_task(send_controls(engine, steer, brake))
+                last_sent = (engine, steer, brake)
+                last_sent_t = time.monotonic()
+                send_pending = False
+
+        # Event-driven wait: while ramping toward a target, keep ticking at
+        # 20 ms; once settled, block until the next real key event arrives
+        # (no idle wakeups at all).
+        needs_ramp = engine != target_engine or steer != target_steer or send_pending
+        if needs_ramp:
             try:
-                await rover.set_rover_controls(
-                    engine=engine, steering_angle=steer, brake=brake
-                )
-            except Exception as e:
-                pass # Ignore connection blips
-        
-        await asyncio.sleep(0.02)
-    
-    listener.stop()
+                await asyncio.wait_for(key_events.get(), timeout=0.02)
+            except asyncio.TimeoutError:
+                pass
+        else:
+            await key_events.get()
+
+    # Stop whichever listener instance is current (the focus handler in
+    # main() may have swapped it out)
+    if rover_state.listener is not None:
+        rover_state.listener.stop()
+    if inflight is not None:
+        # Let the last fire-and-forget RPC drain before the stop command
+        await asyncio.gather(inflight, return_exceptions=True)
     projectairsim_log().info("Rover teleop: disarming & disabling API control.")
     try:
         await rover.set_rover_controls(engine=0.0, steering_angle=0.0, brake=1.0)
@@ -127,10 +262,36 @@ def run_rover_async_loop(rover):
         asyncio.run(rover_keyboard_loop(rover))
     except Exception as e:
         projectairsim_log().error(f"Rover loop exception: {e}", exc_info=True)
-        os._exit(1)
+        # Signal the main thread so it runs its normal teardown (display stop
+        # + client disconnect) instead of os._exit(), which skipped the
+        # finally blocks and left the sim holding stale subscriptions.
+        signal_rover_stop()
+    finally:
+        # Unblocks main's pre-disconnect wait, even if the loop died early
+        rover_state.teardown_done.set()
 
 # ---------------------- Main / Camera Setup ----------------------
 
+def wait_for_robot_topics(client, robot_name, timeout=8.0):
+    """
+    Poll the client's topic table until topics for robot_name show up (or
+    the timeout expires). On SDK builds whose topic table refreshes in
+    place this returns as soon as the spawn lands; builds that populate the
+    table only at connect time can never satisfy the poll, so callers must
+    treat False as "reconnect with a fresh client", the baseline fix.
+    """
+    match = re.compile(re.escape(robot_name)).search
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        topics = getattr(client, 'topics', None) or {}
+        if any(map(match, topics)):
+            return True
+        topics_info = getattr(client, 'topics_info_list', None) or []
+        if any(match(t.name) for t in topics_info):
+            return True
+        time.sleep(0.2)
+    return False
+
 def main():
     parser = argparse.ArgumentParser(description="PX4 Drone + Rover with Dual Camera Feed")
     parser.add_argument("--address", type=str, default="127.0.0.1")
@@ -142,56 +303,115 @@ def main():
 
     # --- PHASE 1: LOAD SCENE ---
     projectairsim_log().info(">>> PHASE 1: Connecting to load scene...")
-    client_loader = projectairsim.ProjectAirSimClient(
+    client = projectairsim.ProjectAirSimClient(
         address=args.address,
         port_topics=args.topicsport,
         port_services=args.servicesport,
     )
-    client_loader.connect()
-    
+    client.connect()
+
     # Load the world (starts the simulator spawning process)
     world = projectairsim.World(
-        client=client_loader,
+        client=client,
         scene_config_name=args.sceneconfigfile,
         sim_config_path=args.simconfigpath
     )
-    
-    # --- PHASE 2: WAIT FOR SPAWN ---
-    # We must wait long enough for the Rover to fully spawn and register topics
-    projectairsim_log().info(">>> PHASE 2: Waiting 8 seconds for robots to spawn...")
-    time.sleep(8) 
-    
-    # Disconnect the loader client to clear any stale topic cache
-    projectairsim_log().info(">>> PHASE 3: Reconnecting to refresh topic list...")
-    client_loader.disconnect()
-    
-    # --- PHASE 3: FRESH CONNECTION ---
-    # Create a BRAND NEW client instance. This forces it to fetch the topic list 
-    # from scratch, which should now include the Rover.
-    client = projectairsim.ProjectAirSimClient(
-        address=args.address,
-        port_topics=args.topicsport,
-        port_services=args.servicesport,
-    )
-    client.connect()
 
-    # We reuse the 'world' object but inject the new client so it stays valid
-    world.client = client
+    # --- PHASE 2: WAIT FOR SPAWN ---
+    # Poll the topic table until the Rover registers instead of sleeping a
+    # blind 8 seconds and paying a second TCP connect + topic fetch.
+    projectairsim_log().info(">>> PHASE 2: Waiting for Rover1 to spawn...")
+    if not wait_for_robot_topics(client, "Rover1"):
+        # The live client's topic table never showed Rover1 — it may only be
+        # populated at connect time on this SDK build. Fall back to the old
+        # fix: a brand-new client fetches the topic list from scratch, so
+        # the camera subscriptions below still find the rover's topics.
+        projectairsim_log().warning(
+            "Rover1 topics not seen on the live client; reconnecting with a fresh client."
+        )
+        client.disconnect()
+        client = projectairsim.ProjectAirSimClient(
+            address=args.address,
+            port_topics=args.topicsport,
+            port_services=args.servicesport,
+        )
+        client.connect()
+        world.client = client  # Update world with new client
 
     # DEBUG: Print all found topics to verify Rover is there
     # (Note: accessing protected member for debugging purposes)
     if hasattr(client, 'topics_info_list'):
         projectairsim_log().info(f"DEBUG: Found {len(client.topics_info_list)} topics.")
-        rover_topics = [t for t in client.topics_info_list if "Rover1" in t.name]
-        if not rover_topics:
+        rover_match = re.compile(r"Rover1").search  # precompiled: C-level scan
+        # any() short-circuits on the first hit; the full list is only built
+        # in the success branch where we report the count
+        if not any(rover_match(t.name) for t in client.topics_info_list):
             projectairsim_log().error("CRITICAL: 'Rover1' topics NOT found in simulator list!")
             projectairsim_log().error("Please check your JSON config files for naming errors.")
         else:
+            rover_topics = [t for t in client.topics_info_list if rover_match(t.name)]
             projectairsim_log().info(f"DEBUG: Verified {len(rover_topics)} topics for Rover1.")
 
     # 3. Initialize ImageDisplay for Camera Feeds
     image_display = ImageDisplay()
 
+    # Frames are handed from the topic subscriber thread to a dedicated
+    # display worker through a small bounded queue, so decode/resize never
+    # runs on the network-receiver thread. Under load we drop the oldest
+    # frame instead of back-pressuring the topic socket.
+    frame_queue = queue.Queue(maxsize=2)
+
+    def queue_frame(img, window):
+        if frame_queue.full():
+            try:
+                frame_queue.get_nowait() # drop the oldest frame
+            except queue.Empty:
+                pass
+        try:
+            frame_queue.put_nowait((window, img))
+        except queue.Full:
+            pass
+
+    def display_worker():
+        while not rover_state.stop.is_set():
+            try:
+                window, img = frame_queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            if turbo_jpeg is not None and isinstance(img, dict):
+                try:
+                    if str(img.get("encoding", "")).upper() in ("JPEG", "JPG"):
+                        img = dict(
+                            img, data=turbo_jpeg.decode(img["data"]), encoding="BGR"
+                        )
+                except Exception:
+                    pass # let ImageDisplay handle the raw frame itself
+            image_display.receive(img, window)
+
+    display_thread = threading.Thread(target=display_worker, daemon=True)
+    display_thread.start()
+
+    # pynput installs a global OS keyboard hook that taxes every keystroke
+    # system-wide. If this ImageDisplay build exposes a focus-change hook,
+    # pause the listener while our windows aren't focused and restart it on
+    # focus-in (a stopped pynput Listener can't be restarted, so build a
+    # fresh one). Builds without the hook keep the always-on listener.
+    if hasattr(image_display, 'on_focus_change'):
+        def handle_focus_change(has_focus):
+            listener = rover_state.listener
+            if has_focus:
+                if listener is None or not listener.running:
+                    listener = keyboard.Listener(
+                        on_press=on_press, on_release=on_release
+                    )
+                    rover_state.listener = listener
+                    listener.start()
+            elif listener is not None and listener.running:
+                listener.stop()
+                rover_state.mask = 0 # drop any keys held across focus loss
+
+        image_display.on_focus_change(handle_focus_change)
+
     # ------------------ DRONE SETUP ------------------
     projectairsim_log().info("Initializing Drone1...")
     drone = projectairsim.Drone(client, world, "Drone1")
@@ -202,7 +422,7 @@ def main():
     if "Chase" in drone.sensors:
         client.subscribe(
             drone.sensors["Chase"]["scene_camera"],
-            lambda _, img: image_display.receive(img, drone_window)
+            lambda _, img: queue_frame(img, drone_window)
         )
     else:
         projectairsim_log().warning("Drone1 'Chase' camera not found! Check connection.")
@@ -213,19 +433,21 @@ def main():
     # Try initializing Rover; if it fails, we catch it to avoid crashing everything
     try:
         rover = projectairsim.Rover(client, world, "Rover1")
-        rover_sensors = projectairsim.Drone(client, world, "Rover1")
-        
+
         projectairsim_log().info("Rover: enabling API & arming")
         rover.enable_api_control()
         rover.arm()
 
         rover_window = "Rover View"
         image_display.add_chase_cam(rover_window, resize_x=1280, resize_y=720)
-        
-        if hasattr(rover_sensors, 'sensors') and "Chase" in rover_sensors.sensors:
+
+        # The Rover object already enumerates its own sensors; building a
+        # second Drone wrapper for "Rover1" just to read .sensors doubled the
+        # startup RPC traffic for the same entity.
+        if hasattr(rover, 'sensors') and "Chase" in rover.sensors:
             client.subscribe(
-                rover_sensors.sensors["Chase"]["scene_camera"],
-                lambda _, img: image_display.receive(img, rover_window)
+                rover.sensors["Chase"]["scene_camera"],
+                lambda _, img: queue_frame(img, rover_window)
             )
         else:
             projectairsim_log().warning("Rover1 'Chase' camera not found! (Sensors might be empty)")
@@ -254,12 +476,17 @@ def main():
     projectairsim_log().info("================================================================")
 
     try:
-        while rover_state.running:
-            time.sleep(1)
+        # Block until 'Q' is pressed; no 1 s polling wakeups, and shutdown
+        # is immediate instead of up to a second late.
+        rover_state.stop.wait()
     except KeyboardInterrupt:
         projectairsim_log().info("Exiting...")
-        rover_state.running = False
+        signal_rover_stop()
     finally:
+        # Let the rover thread finish its teardown (final brake, disarm,
+        # disable API control) before pulling the client connection out from
+        # under it; the old 1 s poll slack used to hide this race.
+        rover_state.teardown_done.wait(timeout=5.0)
         image_display.stop() 
         client.disconnect()
         print("Client disconnected.")
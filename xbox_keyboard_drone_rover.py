@@ -7,15 +7,239 @@ Demonstrates using an Xbox controller as a remote control for SimpleFlight
 AND adds keyboard control for a rover.
 """
 import argparse
+import atexit
+import pickle
+import ctypes
+import os
+import selectors
 import sys
 import asyncio
 import threading
-import msvcrt  # Windows-only
+import time
+from typing import NamedTuple
 
 import projectairsim
 import projectairsim.rc
 from projectairsim.utils import projectairsim_log
 
+IS_WINDOWS = os.name == "nt"
+
+# ---------------------- Console input ----------------------
+
+if IS_WINDOWS:
+    import msvcrt
+
+    # Block at OS level on the console input handle instead of polling
+    # msvcrt.kbhit() every 50 ms: WaitForSingleObject puts the thread to sleep
+    # until a real input event arrives (or the timeout lapses), so the idle
+    # rover loop costs ~0% CPU and keypress latency drops to sub-millisecond.
+    kernel32 = ctypes.windll.kernel32
+    STD_INPUT_HANDLE = -10
+    WAIT_OBJECT_0 = 0
+    INFINITE = 0xFFFFFFFF
+    h_stdin = kernel32.GetStdHandle(STD_INPUT_HANDLE)
+else:
+    import termios
+    import tty
+
+
+def stdin_is_console():
+    """
+    True when stdin is a real console. Redirected stdin has no waitable
+    console handle, so that case keeps the old kbhit polling path.
+    """
+    mode = ctypes.c_ulong()
+    return bool(kernel32.GetConsoleMode(h_stdin, ctypes.byref(mode)))
+
+
+STDIN_IS_CONSOLE = stdin_is_console() if IS_WINDOWS else False
+
+KEY_EVENT = 0x0001
+
+
+# INPUT_RECORD layout for ReadConsoleInputW (KEY_EVENT is the widest member
+# of the event union, so this covers mouse/focus/resize records too)
+class CHAR_UNION(ctypes.Union):
+    _fields_ = [("UnicodeChar", ctypes.c_wchar), ("AsciiChar", ctypes.c_char)]
+
+
+class KEY_EVENT_RECORD(ctypes.Structure):
+    _fields_ = [
+        ("bKeyDown", ctypes.c_int),
+        ("wRepeatCount", ctypes.c_ushort),
+        ("wVirtualKeyCode", ctypes.c_ushort),
+        ("wVirtualScanCode", ctypes.c_ushort),
+        ("uChar", CHAR_UNION),
+        ("dwControlKeyState", ctypes.c_ulong),
+    ]
+
+
+class INPUT_RECORD(ctypes.Structure):
+    _fields_ = [("EventType", ctypes.c_ushort), ("KeyEvent", KEY_EVENT_RECORD)]
+
+
+def read_console_keys():
+    """
+    Drain ALL pending console input via ReadConsoleInputW and return the
+    characters from key-down KEY_EVENT records. Non-key records (mouse,
+    focus, resize) are consumed and dropped here, so they can neither wedge
+    a kbhit()->getch() pair nor keep the input handle signaled.
+    """
+    keys = []
+    buf = (INPUT_RECORD * 16)()
+    n_pending = ctypes.c_ulong()
+    n_read = ctypes.c_ulong()
+    while True:
+        if (
+            not kernel32.GetNumberOfConsoleInputEvents(h_stdin, ctypes.byref(n_pending))
+            or n_pending.value == 0
+        ):
+            return keys
+        if not kernel32.ReadConsoleInputW(
+            h_stdin, buf, min(n_pending.value, 16), ctypes.byref(n_read)
+        ):
+            return keys
+        for i in range(n_read.value):
+            rec = buf[i]
+            if rec.EventType != KEY_EVENT or not rec.KeyEvent.bKeyDown:
+                continue
+            ch = rec.KeyEvent.uChar.UnicodeChar
+            if ch == "\x00":
+                continue  # dead key / modifier / arrow key: no character
+            keys.extend(ch * max(rec.KeyEvent.wRepeatCount, 1))
+
+
+class Win32KeyboardPoller:
+    """
+    Keyboard poller for Windows: blocks on the console input handle via
+    WaitForSingleObject and drains keys with ReadConsoleInputW; redirected
+    stdin falls back to msvcrt polling.
+    """
+
+    def read_keys(self):
+        if STDIN_IS_CONSOLE:
+            if kernel32.WaitForSingleObject(h_stdin, INFINITE) != WAIT_OBJECT_0:
+                return None  # input handle gone
+            return read_console_keys()
+        if msvcrt.kbhit():
+            return [msvcrt.getch().decode("utf-8", errors="replace")]
+        time.sleep(0.05)  # redirected stdin: polling fallback
+        return []
+
+    def restore(self):
+        pass
+
+
+class PosixKeyboardPoller:
+    """
+    Keyboard poller for POSIX: puts the terminal in cbreak mode once and
+    blocks in selectors.DefaultSelector (epoll-backed on Linux) until stdin
+    is readable, so waiting costs no CPU at all. Redirected (non-TTY) stdin
+    skips the cbreak setup and just reads the pipe, mirroring the Windows
+    redirected-stdin fallback.
+    """
+
+    def __init__(self):
+        self._fd = sys.stdin.fileno()
+        self._old_attrs = None
+        if sys.stdin.isatty():
+            try:
+                self._old_attrs = termios.tcgetattr(self._fd)
+                tty.setcbreak(self._fd)
+            except termios.error:
+                self._old_attrs = None  # not a usable TTY: keep default mode
+            else:
+                # The reader runs as a daemon thread, which the interpreter
+                # kills at exit without unwinding its finally blocks — so a
+                # normal quit would leave the user's terminal without echo.
+                # atexit is the restore path that always runs.
+                atexit.register(self.restore)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._fd, selectors.EVENT_READ)
+
+    def read_keys(self):
+        if not self._selector.select():
+            return []
+        data = os.read(self._fd, 64)
+        if not data:
+            return None  # EOF on stdin
+        return [chr(b) for b in data if b < 0x80]
+
+    def restore(self):
+        # Idempotent: called from both the reader's finally and atexit
+        self._selector.close()
+        if self._old_attrs is not None:
+            termios.tcsetattr(self._fd, termios.TCSADRAIN, self._old_attrs)
+            self._old_attrs = None
+
+
+def console_input_reader(loop, key_queue):
+    """
+    Daemon-thread body: block in the platform keyboard poller and push each
+    decoded key into the asyncio queue via call_soon_threadsafe. All waiting
+    happens here at the OS level, so the rover coroutine never schedules
+    timers or sleeps of its own — it just awaits the queue. The thread is a
+    daemon and dies with the process.
+    """
+    poller = Win32KeyboardPoller() if IS_WINDOWS else PosixKeyboardPoller()
+    try:
+        while True:
+            keys = poller.read_keys()
+            if keys is None:
+                return
+            for key in keys:
+                loop.call_soon_threadsafe(key_queue.put_nowait, key)
+    finally:
+        poller.restore()
+
+
+# ---------------------- XInput fast path ----------------------
+
+# Direct XInputGetState polling: dwPacketNumber increments whenever any
+# control on the pad changes, so a single C call tells us whether a read()
+# through the SDK's event-queue path could possibly return new data.
+if IS_WINDOWS:
+    try:
+        _xinput = ctypes.windll.XInput1_4
+    except OSError:
+        try:
+            _xinput = ctypes.windll.XInput9_1_0
+        except OSError:
+            _xinput = None  # no XInput runtime: fast path disabled
+else:
+    _xinput = None  # XInput is Windows-only; fast path disabled
+
+ERROR_SUCCESS = 0
+
+
+class XINPUT_GAMEPAD(ctypes.Structure):
+    _fields_ = [
+        ("wButtons", ctypes.c_ushort),
+        ("bLeftTrigger", ctypes.c_ubyte),
+        ("bRightTrigger", ctypes.c_ubyte),
+        ("sThumbLX", ctypes.c_short),
+        ("sThumbLY", ctypes.c_short),
+        ("sThumbRX", ctypes.c_short),
+        ("sThumbRY", ctypes.c_short),
+    ]
+
+
+class XINPUT_STATE(ctypes.Structure):
+    _fields_ = [("dwPacketNumber", ctypes.c_ulong), ("Gamepad", XINPUT_GAMEPAD)]
+
+
+def xinput_packet_number(user_index=0):
+    """
+    The pad's dwPacketNumber, or None when XInput or the pad is unavailable
+    (callers must then fall back to reading unconditionally).
+    """
+    if _xinput is None:
+        return None
+    state = XINPUT_STATE()
+    if _xinput.XInputGetState(user_index, ctypes.byref(state)) != ERROR_SUCCESS:
+        return None
+    return state.dwPacketNumber
+
 
 # ---------------------- Rover keyboard control ----------------------
 
@@ -27,6 +251,38 @@ STEER_MIN = -1.0
 STEER_MAX = 1.0
 
 
+def clamp(x, lo, hi):
+    """Inline-friendly clamp: two compares instead of a min/max builtin call."""
+    return lo if x < lo else hi if x > hi else x
+
+
+class RoverControls(NamedTuple):
+    """Immutable rover teleop state; handlers return an updated copy."""
+    engine: float = 0.0
+    steer: float = 0.0
+    brake: float = 0.0
+    running: bool = True
+
+
+# Key dispatch table keyed by lowercased ord: O(1) lookup instead of the old
+# seven-branch if/elif chain, and each handler is a small testable callable.
+KEY_TABLE = {
+    ord("w"): lambda s: s._replace(
+        engine=clamp(s.engine + ENGINE_STEP, ENGINE_MIN, ENGINE_MAX), brake=0.0
+    ),
+    ord("s"): lambda s: s._replace(
+        engine=clamp(s.engine - ENGINE_STEP, ENGINE_MIN, ENGINE_MAX), brake=0.0
+    ),
+    ord("a"): lambda s: s._replace(steer=clamp(s.steer - STEER_STEP, STEER_MIN, STEER_MAX)),
+    ord("d"): lambda s: s._replace(steer=clamp(s.steer + STEER_STEP, STEER_MIN, STEER_MAX)),
+    # full brake, stop engine
+    ord(" "): lambda s: s._replace(engine=0.0, brake=1.0),
+    # reset steering & brake, engine 0
+    ord("0"): lambda s: s._replace(engine=0.0, steer=0.0, brake=0.0),
+    ord("q"): lambda s: s._replace(running=False),
+}
+
+
 async def rover_keyboard_loop(rover: projectairsim.Rover):
     """
     Async loop that drives the rover using keyboard input.
@@ -38,84 +294,165 @@ async def rover_keyboard_loop(rover: projectairsim.Rover):
       0 -> release brake, center steering, engine 0
       Q -> quit rover teleop
     """
-    engine = 0.0
-    steer = 0.0
-    brake = 0.0
-    running = True
-
-    projectairsim_log().info(
+    # Resolve the logger once instead of per call in the loop below
+    log = projectairsim_log()
+    state = RoverControls()
+
+    loop = asyncio.get_running_loop()
+
+    # Last (engine, steer, brake) actually sent, plus the in-flight send:
+    # identical commands are skipped outright (e.g. holding W at the clamp),
+    # and the RPC round-trip overlaps the next input wait instead of
+    # blocking the loop.
+    last_sent = None
+    send_fut = None
+
+    async def settle_send(fut):
+        # set_rover_controls is two-stage: the first await returns the task
+        # tracking command completion
+        task = await fut
+        await task
+
+    # Keys flow in from a single long-lived reader thread instead of a
+    # 100 ms-capped executor wait per iteration: no Timer handles churned by
+    # asyncio.sleep, and the worst-case input latency is one queue hop.
+    key_queue = asyncio.Queue()
+    threading.Thread(
+        target=console_input_reader, args=(loop, key_queue), daemon=True
+    ).start()
+
+    log.info(
         "Rover keyboard controls: W/S=throttle, A/D=steer, SPACE=brake, 0=reset, Q=quit"
     )
 
-    while running:
-        if msvcrt.kbhit():
-            key = msvcrt.getch()
-
-            if key in (b"w", b"W"):
-                brake = 0.0
-                engine = min(engine + ENGINE_STEP, ENGINE_MAX)
-
-            elif key in (b"s", b"S"):
-                brake = 0.0
-                engine = max(engine - ENGINE_STEP, ENGINE_MIN)
-
-            elif key in (b"a", b"A"):
-                steer = max(steer - STEER_STEP, STEER_MIN)
-
-            elif key in (b"d", b"D"):
-                steer = min(steer + STEER_STEP, STEER_MAX)
-
-            elif key == b" ":
-                # full brake, stop engine
-                brake = 1.0
-                engine = 0.0
-
-            elif key == b"0":
-                # reset steering & brake, engine 0
-                brake = 0.0
-                steer = 0.0
-                engine = 0.0
-
-            elif key in (b"q", b"Q"):
-                projectairsim_log().info("Rover teleop: Q pressed, stopping.")
-                running = False
-                continue
-
-            # send new controls
-            task = await rover.set_rover_controls(
-                engine=engine, steering_angle=steer, brake=brake
-            )
-            await task
-
-        await asyncio.sleep(0.05)
+    while state.running:
+        # Block until at least one key arrives, then drain any burst that
+        # queued up behind it without blocking again
+        keys = [await key_queue.get()]
+        while not key_queue.empty():
+            keys.append(key_queue.get_nowait())
+
+        # Fold every drained key into the state first, then issue at most one
+        # RPC per wake-up. Under key autorepeat (~30 Hz) this collapses a
+        # burst of events into a single round-trip.
+        handled = False
+        for key in keys:
+            # Branchless ASCII lowercase: one integer OR for A-Z instead of
+            # a str.lower() call per keystroke; space (0x20) and digits pass
+            # through untouched.
+            c = ord(key)
+            if 0x41 <= c <= 0x5A:
+                c |= 0x20
+            handler = KEY_TABLE.get(c)
+            if handler is None:
+                continue  # unmapped key: no state change, no RPC
+
+            state = handler(state)
+            handled = True
+            if not state.running:
+                log.info("Rover teleop: Q pressed, stopping.")
+                break
+
+        # send new controls (only when they actually changed)
+        if handled and state.running:
+            sending = (state.engine, state.steer, state.brake)
+            if sending != last_sent:
+                if send_fut is not None:
+                    # settle the previous overlapped send first (it has had
+                    # a full input-wait's worth of time to finish)
+                    await settle_send(send_fut)
+                send_fut = asyncio.ensure_future(
+                    rover.set_rover_controls(
+                        engine=state.engine,
+                        steering_angle=state.steer,
+                        brake=state.brake,
+                    )
+                )
+                last_sent = sending
+
+    # drain the last overlapped send before teardown
+    if send_fut is not None:
+        await settle_send(send_fut)
 
     # tidy shutdown of rover API control
-    projectairsim_log().info("Rover teleop: disarming & disabling API control.")
-    rover.disarm()
-    rover.disable_api_control()
+    log.info("Rover teleop: disarming & disabling API control.")
+    # Overlap the two teardown round-trips: disarm and disable_api_control
+    # are sync RPCs, so run both in threads and gather. A failure in one
+    # must not skip the other, hence return_exceptions + logging.
+    results = await asyncio.gather(
+        asyncio.to_thread(rover.disarm),
+        asyncio.to_thread(rover.disable_api_control),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            log.error(f"Rover teleop shutdown error: {result}")
 
 
-def start_rover_keyboard_control(client: projectairsim.ProjectAirSimClient,
-                                 world: projectairsim.World,
-                                 rover_name: str = "Rover1"):
+async def rover_teleop(rover: projectairsim.Rover):
     """
-    Thread entry point: create Rover object, arm it, and run the async keyboard loop.
+    Arm the rover and run the keyboard loop. Takes the already-constructed
+    Rover as its only argument: the client/world pair was dead weight here
+    once construction moved to the caller, and the narrower signature keeps
+    this task decoupled from scene loading. Runs as a task in the shared
+    event loop rather than a separate OS thread, so the rover's RPC traffic
+    no longer contends with the drone loop for the GIL or the shared
+    client.
     """
+    log = projectairsim_log()
     try:
-        rover = projectairsim.Rover(client, world, rover_name)
-        projectairsim_log().info("Rover: enabling API & arming")
+        log.info("Rover: enabling API & arming")
         rover.enable_api_control()
         rover.arm()
 
-        asyncio.run(rover_keyboard_loop(rover))
+        await rover_keyboard_loop(rover)
+    except asyncio.CancelledError:
+        raise
     except Exception as e:
-        projectairsim_log().error(f"Rover keyboard control exception: {e}", exc_info=True)
+        log.error(f"Rover keyboard control exception: {e}", exc_info=True)
 
 
 # ---------------------- Drone (Xbox) control ----------------------
 
 
-def main(
+class CachedRCConfig(projectairsim.rc.RCConfig):
+    """
+    RCConfig with a pickle sidecar cache. Parsing the JSONC config strips
+    comments before json.loads on every run; the parsed attributes are
+    persisted to <file>.cache.pkl keyed on the source file's mtime, so warm
+    starts restore them with one pickle.load and skip the parse entirely.
+    The cache is best-effort: any miss or corruption falls back to a full
+    parse and rewrites the sidecar.
+    """
+
+    def load(self, rc_config_file):
+        cache_file = rc_config_file + ".cache.pkl"
+        try:
+            mtime = os.path.getmtime(rc_config_file)
+        except OSError:
+            mtime = None
+
+        if mtime is not None:
+            try:
+                with open(cache_file, "rb") as fh:
+                    cached_mtime, attrs = pickle.load(fh)
+                if cached_mtime == mtime:
+                    self.__dict__.update(attrs)
+                    return
+            except (OSError, pickle.PickleError, EOFError, ValueError, AttributeError):
+                pass  # missing/stale/corrupt sidecar: do the full parse
+
+        super().load(rc_config_file)
+
+        if mtime is not None:
+            try:
+                with open(cache_file, "wb") as fh:
+                    pickle.dump((mtime, dict(self.__dict__)), fh)
+            except (OSError, pickle.PicklingError):
+                pass  # caching is an optimization, never an error
+
+
+async def main(
     client: projectairsim.ProjectAirSimClient, robot_name: str, rc_config_file: str
 ):
     """
@@ -123,24 +460,33 @@ def main(
     Simple Flight flight controller by pairing instances of the
     XboxInputControllerSF and SimpleFlightRC classes.
 
-    This version keeps the original behavior for the drone and assumes
-    a separate thread is running rover keyboard control.
+    Runs in the shared event loop alongside rover_teleop(); the blocking
+    controller read is pushed to the executor so the rover task keeps
+    getting scheduled between input frames.
     """
+    # Resolve the logger once instead of per call in the loop below
+    log = projectairsim_log()
     simple_flight_rc = None
 
+    # Carriage-return-terminated writes flush per frame on a line-buffered
+    # TTY; switch stdout to block buffering and flush explicitly on the
+    # 100 ms display timer below (one write syscall per refresh).
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
+
     # Create the RC configuration object
-    rc_config = projectairsim.rc.RCConfig()
+    rc_config = CachedRCConfig()
 
     # Load configuration mapping the Xbox input controller channels to Simple
     # Flight channels
-    projectairsim_log().info(f'Loading RC config file "{rc_config_file}"')
+    log.info(f'Loading RC config file "{rc_config_file}"')
     is_rc_loaded = False
     try:
         rc_config.load(rc_config_file)
         is_rc_loaded = True
         print("OOB mapping loaded:", rc_config.channel_map_oob)
     except FileNotFoundError:
-        projectairsim_log().error(f"Can't load RC config file: {sys.exc_info()[1]}")
+        log.error(f"Can't load RC config file: {sys.exc_info()[1]}")
 
     # Main processing loop
     if is_rc_loaded:
@@ -153,42 +499,114 @@ def main(
         simple_flight_rc = projectairsim.rc.SimpleFlightRC(client, robot_name)
         simple_flight_rc.rc_config = rc_config
 
-        projectairsim_log().info("Startup complete. The drone is ready to fly!")
-        projectairsim_log().info(
+        log.info("Startup complete. The drone is ready to fly!")
+        log.info(
             "To begin flying, first arm the drone by holding the start button "
             "with the throttle in the neutral position for 0.2s."
         )
-        projectairsim_log().info(
+        log.info(
             "When done flying, disarm the drone by holding the back button "
             "with the throttle in the neutral position for 0.2s."
         )
+        loop = asyncio.get_running_loop()
+        last_print = 0.0
+        last_channels = None
+        last_packet = None
+        channel_fmt = None
         try:
             while True:
-                # Get input controller channels when they change
-                channels = xbox_input_controller_sf.read()
+                # XInput fast path: if the pad's packet number hasn't moved
+                # since the last frame, nothing on the controller changed and
+                # read() cannot return new data — skip the event-queue
+                # round-trip entirely. One ctypes call vs a full read.
+                packet = xinput_packet_number()
+                if packet is not None and packet == last_packet:
+                    await asyncio.sleep(0.001)
+                    continue
+
+                # Get input controller channels when they change (blocking
+                # read runs in the executor so the rover task isn't starved)
+                channels = await loop.run_in_executor(
+                    None, xbox_input_controller_sf.read
+                )
+                last_packet = packet
+
+                # read() is expected to block until the controller state
+                # changes; if a build's read path returns immediately with
+                # unchanged channels, skip the redundant set and yield for
+                # 1 ms so this loop can't burn a whole core while idle.
+                if channels == last_channels:
+                    await asyncio.sleep(0.001)
+                    continue
+                last_channels = list(channels)
 
                 # Send channels to Simple Flight
                 simple_flight_rc.set(channels)
 
-                # Optional: display RC input sent to the flight controller
-                # (you can comment this out if it is too spammy)
-                print("RC input channels: ", end="")
-                with simple_flight_rc._lock:
-                    for channel in simple_flight_rc._channels:
-                        print(f"{channel:> 8.4f} ", end="")
-                print(end="\r")
-
-        except KeyboardInterrupt:
+                # Optional: display RC input sent to the flight controller,
+                # throttled to ~10 Hz.
+                now = time.monotonic()
+                if now - last_print > 0.1:
+                    # Lock-free read: grabbing the list reference and copying
+                    # it element-wise is safe under the GIL (each element
+                    # read is atomic), and a display row torn across one RC
+                    # update is harmless. The RC writer thread never blocks
+                    # on this reader.
+                    snapshot = tuple(simple_flight_rc._channels)
+                    last_print = now
+                    if channel_fmt is None:
+                        # Channel count is fixed, so build the format string
+                        # once; the % operator then formats the whole row in
+                        # one C-level printf dispatch instead of a Python
+                        # format call per channel.
+                        channel_fmt = (
+                            "RC input channels: " + "% 8.4f " * len(snapshot) + "\r"
+                        )
+                    sys.stdout.write(channel_fmt % tuple(snapshot))
+                    sys.stdout.flush()
+
+        except (KeyboardInterrupt, asyncio.CancelledError):
             print()
-            projectairsim_log().info("Exiting...")
+            log.info("Exiting...")
 
     # Shutdown sending RC input to Simple Flight so we can disconnect the client gracefully
     if simple_flight_rc is not None:
         simple_flight_rc.stop()
 
-    # Disconnect the client
-    client.disconnect()
-    print()
+
+async def app_main(args):
+    """
+    Connect the client, load the scene, and run the drone RC loop and the
+    rover keyboard teleop cooperatively in one event loop.
+    """
+    # Create Project AirSim client and load the simulation scene
+    client = projectairsim.ProjectAirSimClient(
+        address=args.address,
+        port_topics=args.topicsport,
+        port_services=args.servicesport,
+    )
+    client.connect()
+    try:
+        world = projectairsim.World(
+            client=client,
+            scene_config_name=args.sceneconfigfile,
+            sim_config_path=args.simconfigpath,
+        )
+
+        # Rover keyboard teleop as a sibling task (was a daemon thread with
+        # its own event loop); it is torn down when the drone loop exits,
+        # matching the old daemon-thread lifetime. The Rover is built here,
+        # next to the World it needs, so the teleop task only sees the robot.
+        rover = projectairsim.Rover(client, world, "Rover1")
+        rover_task = asyncio.create_task(rover_teleop(rover))
+        try:
+            await main(client, "Drone1", args.rcconfigfile)
+        finally:
+            rover_task.cancel()
+            await asyncio.gather(rover_task, return_exceptions=True)
+    finally:
+        client.disconnect()
+        print()
 
 
 if __name__ == "__main__":
@@ -248,26 +666,5 @@ if __name__ == "__main__":
     )
     args = parser.parse_args()
 
-    # Create Project AirSim client and load the simulation scene
-    client = projectairsim.ProjectAirSimClient(
-        address=args.address,
-        port_topics=args.topicsport,
-        port_services=args.servicesport,
-    )
-    client.connect()
-    world = projectairsim.World(
-        client=client,
-        scene_config_name=args.sceneconfigfile,
-        sim_config_path=args.simconfigpath,
-    )
-
-    # Start rover keyboard teleop in a background thread
-    rover_thread = threading.Thread(
-        target=start_rover_keyboard_control,
-        args=(client, world, "Rover1"),
-        daemon=True,
-    )
-    rover_thread.start()
-
-    # Run the drone (Xbox) remote control loop
-    main(client, "Drone1", args.rcconfigfile)
+    # Run the drone RC loop and rover teleop in one shared event loop
+    asyncio.run(app_main(args))
@@ -7,9 +7,11 @@ Demonstrates using an Xbox controller as a remote control for SimpleFlight
 AND adds keyboard control for a rover.
 """
 import argparse
+import pickle
 import sys
 import asyncio
 import threading
+import time
 #import msvcrt  # Windows-only
 
 import projectairsim
@@ -67,10 +69,17 @@ ENGINE_MAX = 1.0
 STEER_MIN = -1.0
 STEER_MAX = 1.0
 
+
+def clamp(x, lo, hi):
+    """Inline-friendly clamp: two compares instead of a min/max builtin call."""
+    return lo if x < lo else hi if x > hi else x
+
 async def rover_keyboard_loop(rover: projectairsim.Rover):
     """
     Async loop that drives the rover using keyboard input.
     """
+    # Resolve the logger once instead of per call in the loop below
+    log = projectairsim_log()
     engine = 0.0
     steer = 0.0
     brake = 0.0
@@ -79,7 +88,7 @@ async def rover_keyboard_loop(rover: projectairsim.Rover):
     # Initialize the cross-platform keyboard handler
     kb = KBHit()
 
-    projectairsim_log().info(
+    log.info(
         "Rover keyboard controls: W/S=throttle, A/D=steer, SPACE=brake, 0=reset, Q=quit"
     )
 
@@ -97,17 +106,17 @@ async def rover_keyboard_loop(rover: projectairsim.Rover):
 
             if key == 'w':
                 brake = 0.0
-                engine = min(engine + ENGINE_STEP, ENGINE_MAX)
+                engine = clamp(engine + ENGINE_STEP, ENGINE_MIN, ENGINE_MAX)
 
             elif key == 's':
                 brake = 0.0
-                engine = max(engine - ENGINE_STEP, ENGINE_MIN)
+                engine = clamp(engine - ENGINE_STEP, ENGINE_MIN, ENGINE_MAX)
 
             elif key == 'a':
-                steer = max(steer - STEER_STEP, STEER_MIN)
+                steer = clamp(steer - STEER_STEP, STEER_MIN, STEER_MAX)
 
             elif key == 'd':
-                steer = min(steer + STEER_STEP, STEER_MAX)
+                steer = clamp(steer + STEER_STEP, STEER_MIN, STEER_MAX)
 
             elif key == ' ':
                 # full brake, stop engine
@@ -121,7 +130,7 @@ async def rover_keyboard_loop(rover: projectairsim.Rover):
                 engine = 0.0
 
             elif key == 'q':
-                projectairsim_log().info("Rover teleop: Q pressed, stopping.")
+                log.info("Rover teleop: Q pressed, stopping.")
                 running = False
                 # Restore terminal settings on Linux before exiting loop
                 if os.name != 'nt':
@@ -136,30 +145,76 @@ async def rover_keyboard_loop(rover: projectairsim.Rover):
 
         await asyncio.sleep(0.05)
 
-    projectairsim_log().info("Rover teleop: disarming & disabling API control.")
-    rover.disarm()
-    rover.disable_api_control()
+    log.info("Rover teleop: disarming & disabling API control.")
+    # Overlap the two teardown round-trips: disarm and disable_api_control
+    # are sync RPCs, so run both in threads and gather. A failure in one
+    # must not skip the other, hence return_exceptions + logging.
+    results = await asyncio.gather(
+        asyncio.to_thread(rover.disarm),
+        asyncio.to_thread(rover.disable_api_control),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            log.error(f"Rover teleop shutdown error: {result}")
 
-def start_rover_keyboard_control(client: projectairsim.ProjectAirSimClient,
-                                 world: projectairsim.World,
-                                 rover_name: str = "Rover1"):
+def start_rover_keyboard_control(rover: projectairsim.Rover):
     """
-    Thread entry point: create Rover object, arm it, and run the async keyboard loop.
+    Thread entry point: arm the already-constructed rover and run the async
+    keyboard loop. Construction happens in the caller next to the World it
+    needs, so the thread starts with just the robot handle.
     """
+    log = projectairsim_log()
     try:
-        rover = projectairsim.Rover(client, world, rover_name)
-        projectairsim_log().info("Rover: enabling API & arming")
+        log.info("Rover: enabling API & arming")
         rover.enable_api_control()
         rover.arm()
 
         asyncio.run(rover_keyboard_loop(rover))
     except Exception as e:
-        projectairsim_log().error(f"Rover keyboard control exception: {e}", exc_info=True)
+        log.error(f"Rover keyboard control exception: {e}", exc_info=True)
 
 
 # ---------------------- Drone (Xbox) control ----------------------
 
 
+class CachedRCConfig(projectairsim.rc.RCConfig):
+    """
+    RCConfig with a pickle sidecar cache. Parsing the JSONC config strips
+    comments before json.loads on every run; the parsed attributes are
+    persisted to <file>.cache.pkl keyed on the source file's mtime, so warm
+    starts restore them with one pickle.load and skip the parse entirely.
+    The cache is best-effort: any miss or corruption falls back to a full
+    parse and rewrites the sidecar.
+    """
+
+    def load(self, rc_config_file):
+        cache_file = rc_config_file + ".cache.pkl"
+        try:
+            mtime = os.path.getmtime(rc_config_file)
+        except OSError:
+            mtime = None
+
+        if mtime is not None:
+            try:
+                with open(cache_file, "rb") as fh:
+                    cached_mtime, attrs = pickle.load(fh)
+                if cached_mtime == mtime:
+                    self.__dict__.update(attrs)
+                    return
+            except (OSError, pickle.PickleError, EOFError, ValueError, AttributeError):
+                pass  # missing/stale/corrupt sidecar: do the full parse
+
+        super().load(rc_config_file)
+
+        if mtime is not None:
+            try:
+                with open(cache_file, "wb") as fh:
+                    pickle.dump((mtime, dict(self.__dict__)), fh)
+            except (OSError, pickle.PicklingError):
+                pass  # caching is an optimization, never an error
+
+
 def main(
     client: projectairsim.ProjectAirSimClient, robot_name: str, rc_config_file: str
 ):
@@ -171,21 +226,29 @@ def main(
     This version keeps the original behavior for the drone and assumes
     a separate thread is running rover keyboard control.
     """
+    # Resolve the logger once instead of per call in the loop below
+    log = projectairsim_log()
     simple_flight_rc = None
 
+    # Carriage-return-terminated writes flush per frame on a line-buffered
+    # TTY; switch stdout to block buffering and flush explicitly on the
+    # 100 ms display timer below (one write syscall per refresh).
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
+
     # Create the RC configuration object
-    rc_config = projectairsim.rc.RCConfig()
+    rc_config = CachedRCConfig()
 
     # Load configuration mapping the Xbox input controller channels to Simple
     # Flight channels
-    projectairsim_log().info(f'Loading RC config file "{rc_config_file}"')
+    log.info(f'Loading RC config file "{rc_config_file}"')
     is_rc_loaded = False
     try:
         rc_config.load(rc_config_file)
         is_rc_loaded = True
         print("OOB mapping loaded:", rc_config.channel_map_oob)
     except FileNotFoundError:
-        projectairsim_log().error(f"Can't load RC config file: {sys.exc_info()[1]}")
+        log.error(f"Can't load RC config file: {sys.exc_info()[1]}")
 
     # Main processing loop
     if is_rc_loaded:
@@ -198,34 +261,60 @@ def main(
         simple_flight_rc = projectairsim.rc.SimpleFlightRC(client, robot_name)
         simple_flight_rc.rc_config = rc_config
 
-        projectairsim_log().info("Startup complete. The drone is ready to fly!")
-        projectairsim_log().info(
+        log.info("Startup complete. The drone is ready to fly!")
+        log.info(
             "To begin flying, first arm the drone by holding the start button "
             "with the throttle in the neutral position for 0.2s."
         )
-        projectairsim_log().info(
+        log.info(
             "When done flying, disarm the drone by holding the back button "
             "with the throttle in the neutral position for 0.2s."
         )
+        last_print = 0.0
+        last_channels = None
+        channel_fmt = None
         try:
             while True:
                 # Get input controller channels when they change
                 channels = xbox_input_controller_sf.read()
 
+                # read() is expected to block until the controller state
+                # changes; if a build's read path returns immediately with
+                # unchanged channels, skip the redundant set and yield for
+                # 1 ms so this loop can't burn a whole core while idle.
+                if channels == last_channels:
+                    time.sleep(0.001)
+                    continue
+                last_channels = list(channels)
+
                 # Send channels to Simple Flight
                 simple_flight_rc.set(channels)
 
-                # Optional: display RC input sent to the flight controller
-                # (you can comment this out if it is too spammy)
-                print("RC input channels: ", end="")
-                with simple_flight_rc._lock:
-                    for channel in simple_flight_rc._channels:
-                        print(f"{channel:> 8.4f} ", end="")
-                print(end="\r")
+                # Optional: display RC input sent to the flight controller,
+                # throttled to ~10 Hz.
+                now = time.monotonic()
+                if now - last_print > 0.1:
+                    # Lock-free read: grabbing the list reference and copying
+                    # it element-wise is safe under the GIL (each element
+                    # read is atomic), and a display row torn across one RC
+                    # update is harmless. The RC writer thread never blocks
+                    # on this reader.
+                    snapshot = tuple(simple_flight_rc._channels)
+                    last_print = now
+                    if channel_fmt is None:
+                        # Channel count is fixed, so build the format string
+                        # once; the % operator then formats the whole row in
+                        # one C-level printf dispatch instead of a Python
+                        # format call per channel.
+                        channel_fmt = (
+                            "RC input channels: " + "% 8.4f " * len(snapshot) + "\r"
+                        )
+                    sys.stdout.write(channel_fmt % tuple(snapshot))
+                    sys.stdout.flush()
 
         except KeyboardInterrupt:
             print()
-            projectairsim_log().info("Exiting...")
+            log.info("Exiting...")
 
     # Shutdown sending RC input to Simple Flight so we can disconnect the client gracefully
     if simple_flight_rc is not None:
@@ -307,9 +396,10 @@ if __name__ == "__main__":
     )
 
     # Start rover keyboard teleop in a background thread
+    rover = projectairsim.Rover(client, world, "Rover1")
     rover_thread = threading.Thread(
         target=start_rover_keyboard_control,
-        args=(client, world, "Rover1"),
+        args=(rover,),
         daemon=True,
     )
     rover_thread.start()